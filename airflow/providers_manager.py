@@ -16,20 +16,14 @@
 # specific language governing permissions and limitations
 # under the License.
 """Manages all providers."""
-import fnmatch
-import importlib
 import json
 import logging
+import operator
 import os
-from collections import OrderedDict
-from functools import wraps
+from functools import lru_cache, wraps
 from time import perf_counter
-from typing import Any, Callable, Dict, List, NamedTuple, Set, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, TypeVar, cast
 
-import jsonschema
-from wtforms import BooleanField, Field, IntegerField, PasswordField, StringField
-
-from airflow.utils import yaml
 from airflow.utils.entry_points import entry_points_with_dist
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.module_loading import import_string
@@ -40,34 +34,80 @@ except ImportError:
     # Try back-ported to PY<37 `importlib_resources`.
     import importlib_resources
 
-ALLOWED_FIELD_CLASSES = [IntegerField, PasswordField, StringField, BooleanField]
+if TYPE_CHECKING:
+    from wtforms import Field
 
 log = logging.getLogger(__name__)
 
+# Prefix of package names of the providers found in airflow sources
+PROVIDERS_PACKAGE_PREFIX = "apache-airflow-providers"
+PROVIDER_YAML_FILE_NAME = "provider.yaml"
+
+# Marks provider.yaml files that could not be loaded. None cannot be used, as it is what an empty
+# provider.yaml parses to and such file still needs to be validated (and rejected)
+_NOT_LOADED = object()
+
+# Retrieves (conn_type, conn_name_attr, hook_name) attributes of hook class in one call
+_get_hook_attributes = operator.attrgetter('conn_type', 'conn_name_attr', 'hook_name')
+
+
+@lru_cache(maxsize=None)
+def _load_schema(schema_file_name: str) -> Dict:
+    """Loads and parses the JSON schema shipped with airflow. The schema is parsed only once."""
+    return json.loads(importlib_resources.read_text('airflow', schema_file_name))
+
+
+def _create_schema_validator(schema: Dict) -> Callable[[Any], Any]:
+    """
+    Creates validation function for the JSON schema.
+    The returned function raises jsonschema.ValidationError when the instance does not match the schema.
+    """
+    import jsonschema
 
-def _create_provider_info_schema_validator():
-    """Creates JSON schema validator from the provider_info.schema.json"""
-    schema = json.loads(importlib_resources.read_text('airflow', 'provider_info.schema.json'))
     cls = jsonschema.validators.validator_for(schema)
-    validator = cls(schema)
-    return validator
+    return cls(schema).validate
+
+
+@lru_cache(maxsize=1)
+def _allowed_field_classes() -> List[type]:
+    """
+    Returns field classes allowed in connection form widgets. wtforms is imported only when
+    the hooks are discovered, so that listing providers does not pay for the import.
+    """
+    from wtforms import BooleanField, IntegerField, PasswordField, StringField
+
+    return [IntegerField, PasswordField, StringField, BooleanField]
 
 
-def _create_customized_form_field_behaviours_schema_validator():
+@lru_cache(maxsize=1)
+def _create_provider_info_schema_validator() -> Callable[[Any], Any]:
+    """Creates JSON schema validator from the provider_info.schema.json"""
+    return _create_schema_validator(_load_schema('provider_info.schema.json'))
+
+
+@lru_cache(maxsize=1)
+def _create_provider_info_list_schema_validator() -> Callable[[Any], Any]:
+    """Creates JSON schema validator for a list of provider infos, so they can be validated at once"""
+    provider_info_schema = _load_schema('provider_info.schema.json')
+    schema = {"$schema": provider_info_schema["$schema"], "type": "array", "items": provider_info_schema}
+    return _create_schema_validator(schema)
+
+
+@lru_cache(maxsize=1)
+def _create_customized_form_field_behaviours_schema_validator() -> Callable[[Any], Any]:
     """Creates JSON schema validator from the customized_form_field_behaviours.schema.json"""
-    schema = json.loads(
-        importlib_resources.read_text('airflow', 'customized_form_field_behaviours.schema.json')
-    )
-    cls = jsonschema.validators.validator_for(schema)
-    validator = cls(schema)
-    return validator
+    return _create_schema_validator(_load_schema('customized_form_field_behaviours.schema.json'))
 
 
-def _sanity_check(provider_package: str, class_name: str) -> bool:
+@lru_cache(maxsize=None)
+def _sanity_check(provider_package: str, class_name: str) -> Optional[Any]:
     """
     Performs sanity check on provider classes.
     For apache-airflow providers - it checks if it starts with appropriate package. For all providers
     it tries to import the provider - checking that there are no exceptions during importing.
+    The result is cached, so each class is imported and checked only once.
+
+    :return: the imported class if the check passes, None otherwise
     """
     if provider_package.startswith("apache-airflow"):
         provider_path = provider_package[len("apache-") :].replace("-", ".")
@@ -78,9 +118,9 @@ def _sanity_check(provider_package: str, class_name: str) -> bool:
                 provider_package,
                 provider_path,
             )
-            return False
+            return None
     try:
-        import_string(class_name)
+        imported_class = import_string(class_name)
     except Exception as e:
         log.warning(
             "Exception when importing '%s' from '%s' package: %s",
@@ -88,8 +128,8 @@ def _sanity_check(provider_package: str, class_name: str) -> bool:
             provider_package,
             e,
         )
-        return False
-    return True
+        return None
+    return imported_class
 
 
 class ProviderInfo(NamedTuple):
@@ -113,7 +153,13 @@ class ConnectionFormWidgetInfo(NamedTuple):
 
     connection_class: str
     package_name: str
-    field: Field
+    field: "Field"
+
+
+def _is_sorted(dictionary: Dict[str, Any]) -> bool:
+    """Checks if keys of the dictionary are in sorted order"""
+    keys = list(dictionary)
+    return all(key <= next_key for key, next_key in zip(keys, keys[1:]))
 
 
 T = TypeVar("T", bound=Callable)
@@ -135,6 +181,10 @@ def provider_info_cache(cache_name: str) -> Callable[[T], T]:
             providers_manager_instance = args[0]
             if cache_name in providers_manager_instance._initialized_cache:
                 return
+            if not logger.isEnabledFor(logging.DEBUG):
+                func(*args, **kwargs)
+                providers_manager_instance._initialized_cache[cache_name] = True
+                return
             start_time = perf_counter()
             logger.debug("Initializing Providers Manager[%s]", cache_name)
             func(*args, **kwargs)
@@ -158,6 +208,7 @@ class ProvidersManager(LoggingMixin):
     """
 
     _instance = None
+    _initialized_instance = False
     resource_version = "0"
 
     def __new__(cls):
@@ -167,6 +218,10 @@ class ProvidersManager(LoggingMixin):
 
     def __init__(self):
         """Initializes the manager."""
+        # __init__ is invoked on every ProvidersManager() call even though __new__ returns the
+        # singleton, so we make sure the already discovered state is not reset
+        if self._initialized_instance:
+            return
         self._initialized_cache: Dict[str, bool] = {}
         # Keeps dict of providers keyed by module name
         self._provider_dict: Dict[str, ProviderInfo] = {}
@@ -181,9 +236,11 @@ class ProvidersManager(LoggingMixin):
         self._secrets_backend_class_name_set: Set[str] = set()
         self._api_auth_backend_module_names: Set[str] = set()
         self._provider_schema_validator = _create_provider_info_schema_validator()
+        self._provider_list_schema_validator = _create_provider_info_list_schema_validator()
         self._customized_form_fields_schema_validator = (
             _create_customized_form_field_behaviours_schema_validator()
         )
+        self._initialized_instance = True
 
     @provider_info_cache("list")
     def initialize_providers_list(self):
@@ -194,16 +251,18 @@ class ProvidersManager(LoggingMixin):
         # in case of local development
         self._discover_all_airflow_builtin_providers_from_local_sources()
         self._discover_all_providers_from_packages()
-        self._provider_dict = OrderedDict(sorted(self._provider_dict.items()))
+        # Local sources are discovered in sorted order, so usually there is no need to sort again
+        if not _is_sorted(self._provider_dict):
+            self._provider_dict = dict(sorted(self._provider_dict.items()))
 
     @provider_info_cache("hooks")
     def initialize_providers_hooks(self):
         """Lazy initialization of providers hooks."""
         self.initialize_providers_list()
         self._discover_hooks()
-        self._hooks_dict = OrderedDict(sorted(self._hooks_dict.items()))
-        self._connection_form_widgets = OrderedDict(sorted(self._connection_form_widgets.items()))
-        self._field_behaviours = OrderedDict(sorted(self._field_behaviours.items()))
+        self._hooks_dict = dict(sorted(self._hooks_dict.items()))
+        self._connection_form_widgets = dict(sorted(self._connection_form_widgets.items()))
+        self._field_behaviours = dict(sorted(self._field_behaviours.items()))
 
     @provider_info_cache("extra_links")
     def initialize_providers_extra_links(self):
@@ -238,28 +297,50 @@ class ProvidersManager(LoggingMixin):
         together with the code. The runtime version is more relaxed (allows for additional properties)
         and verifies only the subset of fields that are needed at runtime.
         """
+        # Provider infos are collected first so that all of them can be validated in a single call
+        discovered_providers: Dict[str, ProviderInfo] = {}
         for entry_point, dist in entry_points_with_dist('apache_airflow_provider'):
             package_name = dist.metadata['name']
-            if self._provider_dict.get(package_name) is not None:
+            if package_name in self._provider_dict or package_name in discovered_providers:
+                # Already registered from local sources or by another entry point of the same package
                 continue
             log.debug("Loading %s from package %s", entry_point, package_name)
-            version = dist.version
-            provider_info = entry_point.load()()
-            self._provider_schema_validator.validate(provider_info)
-            provider_info_package_name = provider_info['package-name']
+            discovered_providers[package_name] = ProviderInfo(dist.version, entry_point.load()())
+        errors = self._validate_provider_infos(
+            [provider.provider_info for provider in discovered_providers.values()]
+        )
+        for (package_name, provider), error in zip(discovered_providers.items(), errors):
+            if error is not None:
+                raise error
+            provider_info_package_name = provider.provider_info['package-name']
             if package_name != provider_info_package_name:
                 raise Exception(
                     f"The package '{package_name}' from setuptools and "
                     f"{provider_info_package_name} do not match. Please make sure they are aligned"
                 )
-            if package_name not in self._provider_dict:
-                self._provider_dict[package_name] = ProviderInfo(version, provider_info)
-            else:
-                log.warning(
-                    "The provider for package '%s' could not be registered from because providers for that "
-                    "package name have already been registered",
-                    package_name,
-                )
+            self._provider_dict[package_name] = provider
+
+    def _validate_provider_infos(self, provider_infos: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Validates provider infos against the provider_info schema. All of them are validated in a
+        single call, only if that fails they are validated one by one to find the invalid ones.
+
+        :param provider_infos: list of provider info dictionaries to validate
+        :return: list of validation errors (None for valid provider info) in the same order
+        """
+        try:
+            self._provider_list_schema_validator(provider_infos)
+            return [None] * len(provider_infos)
+        except Exception:
+            pass
+        errors: List[Optional[Exception]] = []
+        for provider_info in provider_infos:
+            try:
+                self._provider_schema_validator(provider_info)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
 
     def _discover_all_airflow_builtin_providers_from_local_sources(self) -> None:
         """
@@ -287,55 +368,90 @@ class ProvidersManager(LoggingMixin):
 
         :param path: path where to look for provider.yaml files
         """
-        root_path = path
-        for folder, subdirs, files in os.walk(path, topdown=True):
-            for filename in fnmatch.filter(files, "provider.yaml"):
-                package_name = "apache-airflow-providers" + folder[len(root_path) :].replace(os.sep, "-")
-                self._add_provider_info_from_local_source_file(os.path.join(folder, filename), package_name)
-                subdirs[:] = []
-
-    def _add_provider_info_from_local_source_file(self, path, package_name) -> None:
+        provider_yaml_files: List[Tuple[str, str]] = []
+        # Package name of each folder is built while descending rather than derived from its path
+        folders = [(path, PROVIDERS_PACKAGE_PREFIX)]
+        while folders:
+            folder, package_name = folders.pop()
+            provider_yaml_path = None
+            subfolders = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name == PROVIDER_YAML_FILE_NAME and entry.is_file():
+                            provider_yaml_path = entry.path
+                        elif entry.is_dir(follow_symlinks=False):
+                            subfolders.append((entry.path, package_name + "-" + entry.name))
+            except OSError as e:
+                log.debug("Cannot scan '%s' for provider.yaml files: %s", folder, e)
+                continue
+            if provider_yaml_path:
+                # Providers are not nested, so there is no need to look into the provider's subfolders
+                provider_yaml_files.append((provider_yaml_path, package_name))
+            else:
+                # Folders are pushed in reverse order, so that providers are found in package name order
+                subfolders.sort(reverse=True)
+                folders.extend(subfolders)
+        self._add_provider_info_from_local_source_files(provider_yaml_files)
+
+    @staticmethod
+    def _load_provider_info_from_local_source_file(path: str, package_name: str) -> Any:
         """
-        Parses found provider.yaml file and adds found provider to the dictionary.
+        Parses found provider.yaml file.
 
         :param path: full file path of the provider.yaml file
         :param package_name: name of the package
+        :return: parsed provider info or _NOT_LOADED if the file could not be read or parsed
         """
+        from airflow.utils import yaml
+
         try:
             log.debug("Loading %s from %s", package_name, path)
-            with open(path) as provider_yaml_file:
-                provider_info = yaml.safe_load(provider_yaml_file)
-            self._provider_schema_validator.validate(provider_info)
-
-            version = provider_info['versions'][0]
-            if package_name not in self._provider_dict:
-                self._provider_dict[package_name] = ProviderInfo(version, provider_info)
-            else:
-                log.warning(
-                    "The providers for package '%s' could not be registered because providers for that "
-                    "package name have already been registered",
-                    package_name,
-                )
+            # yaml.safe_load uses the libyaml CSafeLoader when available - passing the binary stream
+            # lets libyaml decode the file itself rather than going through the text I/O layer
+            with open(path, "rb") as provider_yaml_file:
+                return yaml.safe_load(provider_yaml_file)
         except Exception as e:
             log.warning("Error when loading '%s': %s", path, e)
+            return _NOT_LOADED
+
+    def _add_provider_info_from_local_source_files(self, provider_yaml_files: List[Tuple[str, str]]) -> None:
+        """
+        Parses found provider.yaml files and adds found providers to the dictionary.
+
+        :param provider_yaml_files: list of (path, package_name) tuples of the provider.yaml files
+        """
+        loaded_providers = []
+        for path, package_name in provider_yaml_files:
+            provider_info = self._load_provider_info_from_local_source_file(path, package_name)
+            if provider_info is not _NOT_LOADED:
+                loaded_providers.append((path, package_name, provider_info))
+        errors = self._validate_provider_infos([provider_info for _, _, provider_info in loaded_providers])
+        for (path, package_name, provider_info), error in zip(loaded_providers, errors):
+            if error is not None:
+                log.warning("Error when loading '%s': %s", path, error)
+                continue
+            try:
+                version = provider_info['versions'][0]
+                if package_name not in self._provider_dict:
+                    self._provider_dict[package_name] = ProviderInfo(version, provider_info)
+                else:
+                    log.warning(
+                        "The providers for package '%s' could not be registered because providers for "
+                        "that package name have already been registered",
+                        package_name,
+                    )
+            except Exception as e:
+                log.warning("Error when loading '%s': %s", path, e)
 
     def _discover_hooks(self) -> None:
         """Retrieves all connections defined in the providers"""
-        for name, provider in self._provider_dict.items():
-            provider_package = name
-            hook_class_names = provider[1].get("hook-class-names")
+        for provider_package, provider in self._provider_dict.items():
+            hook_class_names = provider.provider_info.get("hook-class-names")
             if hook_class_names:
                 for hook_class_name in hook_class_names:
                     self._add_hook(hook_class_name, provider_package)
 
-    @staticmethod
-    def _get_attr(obj: Any, attr_name: str):
-        """Retrieves attributes of an object, or warns if not found"""
-        if not hasattr(obj, attr_name):
-            log.warning("The '%s' is missing %s attribute and cannot be registered", obj, attr_name)
-            return None
-        return getattr(obj, attr_name)
-
     def _add_hook(self, hook_class_name: str, provider_package: str) -> None:
         """
         Adds hook class name to list of hooks
@@ -343,7 +459,9 @@ class ProvidersManager(LoggingMixin):
         :param hook_class_name: name of the Hook class
         :param provider_package: provider package adding the hook
         """
-        if not _sanity_check(provider_package, hook_class_name):
+        # The sanity check returns the already imported class, so it is not imported again
+        hook_class = _sanity_check(provider_package, hook_class_name)
+        if hook_class is None:
             return
         if hook_class_name in self._hooks_dict:
             log.warning(
@@ -352,26 +470,26 @@ class ProvidersManager(LoggingMixin):
             )
             return
         try:
-            module, class_name = hook_class_name.rsplit('.', maxsplit=1)
-            hook_class = getattr(importlib.import_module(module), class_name)
             # Do not use attr here. We want to check only direct class fields not those
             # inherited from parent hook. This way we add form fields only once for the whole
             # hierarchy and we add it only from the parent hook that provides those!
-            if 'get_connection_form_widgets' in hook_class.__dict__:
+            hook_class_dict = vars(hook_class)
+            if 'get_connection_form_widgets' in hook_class_dict:
                 widgets = hook_class.get_connection_form_widgets()
                 if widgets:
+                    allowed_field_classes = _allowed_field_classes()
                     for widget in widgets.values():
-                        if widget.field_class not in ALLOWED_FIELD_CLASSES:
+                        if widget.field_class not in allowed_field_classes:
                             log.warning(
                                 "The hook_class '%s' uses field of unsupported class '%s'. "
                                 "Only '%s' field classes are supported",
                                 hook_class_name,
                                 widget.field_class,
-                                ALLOWED_FIELD_CLASSES,
+                                allowed_field_classes,
                             )
                             return
                     self._add_widgets(provider_package, hook_class, widgets)
-            if 'get_ui_field_behaviour' in hook_class.__dict__:
+            if 'get_ui_field_behaviour' in hook_class_dict:
                 field_behaviours = hook_class.get_ui_field_behaviour()
                 if field_behaviours:
                     self._add_customized_fields(provider_package, hook_class, field_behaviours)
@@ -395,9 +513,11 @@ class ProvidersManager(LoggingMixin):
             )
             return
 
-        conn_type: str = self._get_attr(hook_class, 'conn_type')
-        connection_id_attribute_name: str = self._get_attr(hook_class, 'conn_name_attr')
-        hook_name: str = self._get_attr(hook_class, 'hook_name')
+        try:
+            conn_type, connection_id_attribute_name, hook_name = _get_hook_attributes(hook_class)
+        except AttributeError as e:
+            log.warning("The '%s' cannot be registered: %s", hook_class, e)
+            return
 
         if not conn_type or not connection_id_attribute_name or not hook_name:
             return
@@ -409,7 +529,7 @@ class ProvidersManager(LoggingMixin):
             hook_name,
         )
 
-    def _add_widgets(self, package_name: str, hook_class: type, widgets: Dict[str, Field]):
+    def _add_widgets(self, package_name: str, hook_class: type, widgets: Dict[str, "Field"]):
         for field_name, field in widgets.items():
             if not field_name.startswith("extra__"):
                 log.warning(
@@ -433,7 +553,7 @@ class ProvidersManager(LoggingMixin):
     def _add_customized_fields(self, package_name: str, hook_class: type, customized_fields: Dict):
         try:
             connection_type = getattr(hook_class, "conn_type")
-            self._customized_form_fields_schema_validator.validate(customized_fields)
+            self._customized_form_fields_schema_validator(customized_fields)
             if connection_type in self._field_behaviours:
                 log.warning(
                     "The connection_type %s from package %s and class %s has already been added "
@@ -454,80 +574,95 @@ class ProvidersManager(LoggingMixin):
 
     def _discover_extra_links(self) -> None:
         """Retrieves all extra links defined in the providers"""
-        for provider_package, (_, provider) in self._provider_dict.items():
+        for provider_package, provider_info in self._provider_dict.items():
+            provider = provider_info.provider_info
             if provider.get("extra-links"):
                 for extra_link_class_name in provider["extra-links"]:
-                    if _sanity_check(provider_package, extra_link_class_name):
+                    if _sanity_check(provider_package, extra_link_class_name) is not None:
                         self._extra_link_class_name_set.add(extra_link_class_name)
 
     def _discover_logging(self) -> None:
         """Retrieves all logging defined in the providers"""
-        for provider_package, (_, provider) in self._provider_dict.items():
+        for provider_package, provider_info in self._provider_dict.items():
+            provider = provider_info.provider_info
             if provider.get("logging"):
                 for logging_class_name in provider["logging"]:
-                    if _sanity_check(provider_package, logging_class_name):
+                    if _sanity_check(provider_package, logging_class_name) is not None:
                         self._logging_class_name_set.add(logging_class_name)
 
     def _discover_secrets_backends(self) -> None:
         """Retrieves all secrets backends defined in the providers"""
-        for provider_package, (_, provider) in self._provider_dict.items():
+        for provider_package, provider_info in self._provider_dict.items():
+            provider = provider_info.provider_info
             if provider.get("secrets-backends"):
                 for secrets_backends_class_name in provider["secrets-backends"]:
-                    if _sanity_check(provider_package, secrets_backends_class_name):
+                    if _sanity_check(provider_package, secrets_backends_class_name) is not None:
                         self._secrets_backend_class_name_set.add(secrets_backends_class_name)
 
     def _discover_auth_backends(self) -> None:
         """Retrieves all API auth backends defined in the providers"""
-        for provider_package, (_, provider) in self._provider_dict.items():
+        for provider_package, provider_info in self._provider_dict.items():
+            provider = provider_info.provider_info
             if provider.get("auth-backends"):
                 for auth_backend_module_name in provider["auth-backends"]:
-                    if _sanity_check(provider_package, auth_backend_module_name + ".init_app"):
+                    if _sanity_check(provider_package, auth_backend_module_name + ".init_app") is not None:
                         self._api_auth_backend_module_names.add(auth_backend_module_name)
 
+    # The properties check the initialization cache themselves to skip the provider_info_cache
+    # wrapper once the information has been initialized, as they are accessed very frequently
+
     @property
     def providers(self) -> Dict[str, ProviderInfo]:
         """Returns information about available providers."""
-        self.initialize_providers_list()
+        if "list" not in self._initialized_cache:
+            self.initialize_providers_list()
         return self._provider_dict
 
     @property
     def hooks(self) -> Dict[str, HookInfo]:
         """Returns dictionary of connection_type-to-hook mapping"""
-        self.initialize_providers_hooks()
+        if "hooks" not in self._initialized_cache:
+            self.initialize_providers_hooks()
         return self._hooks_dict
 
     @property
     def extra_links_class_names(self) -> List[str]:
         """Returns set of extra link class names."""
-        self.initialize_providers_extra_links()
+        if "extra_links" not in self._initialized_cache:
+            self.initialize_providers_extra_links()
         return sorted(self._extra_link_class_name_set)
 
     @property
     def connection_form_widgets(self) -> Dict[str, ConnectionFormWidgetInfo]:
         """Returns widgets for connection forms."""
-        self.initialize_providers_hooks()
+        if "hooks" not in self._initialized_cache:
+            self.initialize_providers_hooks()
         return self._connection_form_widgets
 
     @property
     def field_behaviours(self) -> Dict[str, Dict]:
         """Returns dictionary with field behaviours for connection types."""
-        self.initialize_providers_hooks()
+        if "hooks" not in self._initialized_cache:
+            self.initialize_providers_hooks()
         return self._field_behaviours
 
     @property
     def logging_class_names(self) -> List[str]:
         """Returns set of log task handlers class names."""
-        self.initialize_providers_logging()
+        if "logging" not in self._initialized_cache:
+            self.initialize_providers_logging()
         return sorted(self._logging_class_name_set)
 
     @property
     def secrets_backend_class_names(self) -> List[str]:
         """Returns set of secret backend class names."""
-        self.initialize_providers_secrets_backends()
+        if "secrets_backends" not in self._initialized_cache:
+            self.initialize_providers_secrets_backends()
         return sorted(self._secrets_backend_class_name_set)
 
     @property
     def auth_backend_module_names(self) -> List[str]:
         """Returns set of API auth backend class names."""
-        self.initialize_providers_auth_backends()
+        if "auth_backends" not in self._initialized_cache:
+            self.initialize_providers_auth_backends()
         return sorted(self._api_auth_backend_module_names)